@@ -7,40 +7,183 @@ Uso:
 """
 
 import json
+import os
 import sys
+import time
 import argparse
+import threading
+import concurrent.futures
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError, NoCredentialsError
 from typing import List, Dict, Set, Tuple
 
+# ijson é opcional: permite parse em streaming de listas muito grandes
+# sem materializar o arquivo inteiro em memória
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# orjson é opcional: parse de JSON bem mais rápido que a stdlib para
+# listas grandes de strings
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Cache de sessões boto3 por região: evita repetir a varredura da cadeia
+# de credenciais quando o módulo é importado e usado mais de uma vez
+_SESSIONS: Dict[str, boto3.session.Session] = {}
+
+
+def _get_session(region: str = '') -> boto3.session.Session:
+    """Retorna a sessão boto3 da região, criando e cacheando se necessário."""
+    if region not in _SESSIONS:
+        _SESSIONS[region] = boto3.session.Session()
+    return _SESSIONS[region]
+
+
+class _RateLimiter:
+    """Limitador de requisições por segundo no estilo token bucket."""
+
+    def __init__(self, rate: float):
+        """
+        Args:
+            rate: Número máximo de requisições por segundo
+        """
+        self._interval = 1.0 / rate
+        self._lock = threading.Lock()
+        self._next_time = time.monotonic()
+
+    def acquire(self):
+        """Bloqueia até haver um token disponível."""
+        with self._lock:
+            now = time.monotonic()
+            if self._next_time < now:
+                self._next_time = now
+            wait = self._next_time - now
+            self._next_time += self._interval
+        if wait > 0:
+            time.sleep(wait)
+
 
 class CloudWatchAlarmUpdater:
     """Classe para atualizar ações SNS dos alarmes do CloudWatch."""
     
     # Estados válidos dos alarmes
     VALID_STATES = ['OK', 'IN_ALARM', 'INSUFFICIENT_DATA']
-    
-    def __init__(self, dry_run: bool = False):
+
+    # Códigos de erro de throttling das APIs do CloudWatch; o retry
+    # adaptativo do botocore já faz o backoff antes de chegarem aqui
+    THROTTLING_ERROR_CODES = frozenset([
+        'Throttling',
+        'ThrottlingException',
+        'RequestLimitExceeded',
+        'TooManyRequestsException'
+    ])
+
+    # Mapeia cada estado para o campo de ações correspondente do alarme
+    STATE_TO_KEY = {
+        'OK': 'OKActions',
+        'IN_ALARM': 'AlarmActions',
+        'INSUFFICIENT_DATA': 'InsufficientDataActions'
+    }
+
+    # Campos do alarme aceitos por put_metric_alarm e que devem ser
+    # preservados na atualização (as listas de ações são tratadas à parte)
+    PUT_METRIC_ALARM_FIELDS = (
+        'MetricName',
+        'Namespace',
+        'Period',
+        'EvaluationPeriods',
+        'Threshold',
+        'ComparisonOperator',
+        'Statistic',
+        'ExtendedStatistic',
+        'Unit',
+        'AlarmDescription',
+        'TreatMissingData',
+        'EvaluateLowSampleCountPercentile',
+        'Dimensions',
+        'DatapointsToAlarm',
+        'ThresholdMetricId',
+        'Metrics',
+        'Tags',
+        'ActionsEnabled'
+    )
+
+    # Campos de métrica simples, mutuamente exclusivos com 'Metrics'
+    # (alarmes de metric math); enviá-los juntos causa erro de validação
+    SINGLE_METRIC_FIELDS = (
+        'MetricName',
+        'Namespace',
+        'Period',
+        'Statistic',
+        'ExtendedStatistic',
+        'Unit'
+    )
+
+    # Número padrão de threads para atualizar alarmes em paralelo
+    MAX_WORKERS = 8
+
+    # Número de threads para buscar lotes de alarmes em paralelo
+    DESCRIBE_WORKERS = 8
+
+    # Máximo de nomes por chamada de describe_alarms (limite da API)
+    MAX_BATCH_SIZE = 100
+
+    # Tempo de vida do cache de lotes de describe_alarms, em segundos;
+    # evita repetir buscas idênticas quando process_alarms é chamado mais
+    # de uma vez no mesmo processo (ex.: estados diferentes, mesma lista)
+    DESCRIBE_CACHE_TTL = 30
+
+    # A partir desta quantidade de alarmes é mais barato paginar todos os
+    # alarmes da conta de uma vez do que buscar em lotes de 100 nomes
+    FULL_SCAN_THRESHOLD = 500
+
+    # Arquivos acima deste tamanho são lidos em streaming via ijson;
+    # abaixo disso o json.load padrão é mais rápido
+    STREAM_THRESHOLD_BYTES = 1024 * 1024
+
+
+    def __init__(self, dry_run: bool = False, max_workers: int = None,
+                 batch_size: int = None, rate_limit: float = None):
         """
         Inicializa o atualizador de alarmes.
-        
+
         Args:
             dry_run: Se True, apenas simula as operações sem fazer alterações
+            max_workers: Número de threads para atualizações em paralelo
+            batch_size: Tamanho dos lotes de busca (limitado ao máximo da API)
+            rate_limit: Limite de atualizações por segundo (None = sem limite)
         """
         self.dry_run = dry_run
+        self.max_workers = max_workers or self.MAX_WORKERS
+        self.batch_size = min(batch_size or self.MAX_BATCH_SIZE, self.MAX_BATCH_SIZE)
+        self._rate_limiter = _RateLimiter(rate_limit) if rate_limit else None
+        self._describe_cache = {}
+        self._describe_cache_lock = threading.Lock()
         self._init_aws_client()
         
     def _init_aws_client(self):
         """Inicializa o cliente boto3 do CloudWatch usando credenciais do ambiente."""
         try:
             # Usar credenciais do ambiente (configuradas pelo workflow do GitHub Actions)
-            self.cloudwatch = boto3.client('cloudwatch')
+            # Pool de conexões dimensionado para as threads e retry adaptativo
+            # para lidar com throttling das APIs do CloudWatch; tcp_keepalive
+            # evita novos handshakes TLS em execuções longas e a região fixa
+            # do ambiente poupa a resolução de região do provedor de credenciais
+            config = Config(
+                max_pool_connections=max(self.max_workers, self.DESCRIBE_WORKERS) * 2,
+                retries={'mode': 'adaptive', 'max_attempts': 10},
+                tcp_keepalive=True,
+                region_name=os.environ.get('AWS_REGION')
+            )
+            session = _get_session(os.environ.get('AWS_REGION', ''))
+            self.cloudwatch = session.client('cloudwatch', config=config)
             print("✓ Usando credenciais do ambiente AWS")
-                
-        except NoCredentialsError:
-            print("✗ Erro: Credenciais AWS não encontradas")
-            print("  Certifique-se de que as credenciais foram configuradas pelo workflow")
-            sys.exit(1)
+
         except ClientError as e:
             print(f"✗ Erro ao inicializar cliente CloudWatch: {e}")
             sys.exit(1)
@@ -56,22 +199,35 @@ class CloudWatchAlarmUpdater:
             Lista de nomes dos alarmes
         """
         try:
-            with open(json_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                
-            # Suporta tanto lista direta quanto objeto com chave 'alarms'
-            if isinstance(data, list):
-                alarms = data
-            elif isinstance(data, dict) and 'alarms' in data:
-                alarms = data['alarms']
+            # JSON Lines: um registro por linha, lido em streaming
+            if json_path.endswith(('.jsonl', '.ndjson')):
+                names = self._load_jsonl_alarm_names(json_path)
+            # Arquivos grandes: parse em streaming para não materializar
+            # o grafo de objetos inteiro em memória
+            elif ijson is not None and os.path.getsize(json_path) > self.STREAM_THRESHOLD_BYTES:
+                names = self._stream_alarm_names(json_path)
             else:
-                raise ValueError("Formato JSON inválido. Esperado lista ou objeto com chave 'alarms'")
-            
-            # Remove duplicatas e ordena
-            alarms = sorted(list(set(alarms)))
+                if orjson is not None:
+                    with open(json_path, 'rb') as f:
+                        data = orjson.loads(f.read())
+                else:
+                    with open(json_path, 'r', encoding='utf-8') as f:
+                        data = json.load(f)
+
+                # Suporta tanto lista direta quanto objeto com chave 'alarms'
+                if isinstance(data, list):
+                    names = data
+                elif isinstance(data, dict) and 'alarms' in data:
+                    names = data['alarms']
+                else:
+                    raise ValueError("Formato JSON inválido. Esperado lista ou objeto com chave 'alarms'")
+
+            # Remove duplicatas em O(N) preservando a ordem de inserção;
+            # a ordenação é só questão de exibição e fica nos pontos de impressão
+            alarms = list(dict.fromkeys(names))
             print(f"✓ Carregados {len(alarms)} alarmes únicos de {json_path}")
             return alarms
-            
+
         except FileNotFoundError:
             print(f"✗ Erro: Arquivo {json_path} não encontrado")
             sys.exit(1)
@@ -82,62 +238,196 @@ class CloudWatchAlarmUpdater:
             print(f"✗ Erro ao carregar lista de alarmes: {e}")
             sys.exit(1)
     
+    def _load_jsonl_alarm_names(self, jsonl_path: str) -> Set[str]:
+        """
+        Lê nomes de alarmes de um arquivo JSON Lines (.jsonl/.ndjson).
+
+        Cada linha contém um registro: uma string com o nome do alarme
+        ou um objeto com a chave 'AlarmName'.
+
+        Args:
+            jsonl_path: Caminho para o arquivo JSON Lines
+
+        Returns:
+            Conjunto com os nomes únicos dos alarmes
+        """
+        names = set()
+        with open(jsonl_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                record = json.loads(line)
+                if isinstance(record, str):
+                    names.add(record)
+                elif isinstance(record, dict) and 'AlarmName' in record:
+                    names.add(record['AlarmName'])
+                else:
+                    raise ValueError(
+                        "Formato JSON Lines inválido. Esperado string ou objeto com chave 'AlarmName'"
+                    )
+        return names
+
+    def _stream_alarm_names(self, json_path: str) -> Set[str]:
+        """
+        Lê os nomes dos alarmes em streaming via ijson.
+
+        Args:
+            json_path: Caminho para o arquivo JSON com a lista de alarmes
+
+        Returns:
+            Conjunto com os nomes únicos dos alarmes
+        """
+        with open(json_path, 'rb') as f:
+            # Detectar se o arquivo é uma lista direta ou objeto com 'alarms'
+            first_char = f.read(1)
+            while first_char.isspace():
+                first_char = f.read(1)
+            f.seek(0)
+
+            if first_char == b'[':
+                prefix = 'item'
+            elif first_char == b'{':
+                prefix = 'alarms.item'
+            else:
+                raise ValueError("Formato JSON inválido. Esperado lista ou objeto com chave 'alarms'")
+
+            # Alimenta o set diretamente, sem materializar a lista completa
+            return {name for name in ijson.items(f, prefix)}
+
     def get_alarm_details(self, alarm_names: List[str]) -> Tuple[Dict[str, Dict], List[str]]:
         """
         Busca detalhes dos alarmes no CloudWatch.
-        
+
         Args:
             alarm_names: Lista de nomes dos alarmes
-            
+
         Returns:
             Tupla contendo:
-            - Dicionário com nome do alarme como chave e detalhes como valor
+            - Dicionário com nome do alarme como chave e o alarme completo como valor
             - Lista de alarmes não encontrados
         """
         alarms_details = {}
         not_found = []
-        
-        # CloudWatch permite buscar até 100 alarmes por vez
-        batch_size = 100
-        for i in range(0, len(alarm_names), batch_size):
-            batch = alarm_names[i:i + batch_size]
-            
+
+        # Para listas grandes, paginar todos os alarmes da conta de uma vez
+        # e filtrar localmente (menos chamadas à API e trata NextToken)
+        if len(alarm_names) > self.FULL_SCAN_THRESHOLD:
             try:
-                response = self.cloudwatch.describe_alarms(
-                    AlarmNames=batch
-                )
-                
-                for alarm in response['MetricAlarms']:
-                    alarm_name = alarm['AlarmName']
-                    alarms_details[alarm_name] = {
-                        'AlarmName': alarm_name,
-                        'AlarmArn': alarm.get('AlarmArn', ''),
-                        'OKActions': alarm.get('OKActions', []),
-                        'AlarmActions': alarm.get('AlarmActions', []),
-                        'InsufficientDataActions': alarm.get('InsufficientDataActions', [])
-                    }
-                
-                # Verificar alarmes não encontrados
-                found_names = {a['AlarmName'] for a in response['MetricAlarms']}
-                not_found.extend([name for name in batch if name not in found_names])
-                
+                wanted = set(alarm_names)
+                paginator = self.cloudwatch.get_paginator('describe_alarms')
+                for page in paginator.paginate(PaginationConfig={'PageSize': 100}):
+                    for alarm in page['MetricAlarms']:
+                        if alarm['AlarmName'] in wanted:
+                            alarms_details[alarm['AlarmName']] = alarm
+
+                not_found = [name for name in alarm_names if name not in alarms_details]
+                return alarms_details, not_found
+
+            except NoCredentialsError:
+                print("✗ Erro: Credenciais AWS não encontradas")
+                print("  Certifique-se de que as credenciais foram configuradas pelo workflow")
+                sys.exit(1)
             except ClientError as e:
                 print(f"✗ Erro ao buscar alarmes: {e}")
                 sys.exit(1)
-        
+
+        # CloudWatch permite buscar até 100 alarmes por vez; os lotes são
+        # independentes entre si, então são buscados em paralelo
+        batch_size = self.batch_size
+        batches = [alarm_names[i:i + batch_size]
+                   for i in range(0, len(alarm_names), batch_size)]
+
+        try:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=self.DESCRIBE_WORKERS) as executor:
+                futures = {
+                    executor.submit(self._describe_batch, batch): batch
+                    for batch in batches
+                }
+                for future in concurrent.futures.as_completed(futures):
+                    batch = futures[future]
+                    metric_alarms = future.result()
+
+                    # Guardar o alarme completo para reutilizar na atualização
+                    # (evita um describe_alarms extra por alarme)
+                    for alarm in metric_alarms:
+                        alarms_details[alarm['AlarmName']] = alarm
+
+                    # Verificar alarmes não encontrados
+                    found_names = {a['AlarmName'] for a in metric_alarms}
+                    not_found.extend([name for name in batch if name not in found_names])
+
+        except NoCredentialsError:
+            print("✗ Erro: Credenciais AWS não encontradas")
+            print("  Certifique-se de que as credenciais foram configuradas pelo workflow")
+            sys.exit(1)
+        except ClientError as e:
+            print(f"✗ Erro ao buscar alarmes: {e}")
+            sys.exit(1)
+
         return alarms_details, not_found
+
+    def _describe_batch(self, batch: List[str]) -> List[Dict]:
+        """
+        Busca um lote de até 100 alarmes no CloudWatch.
+
+        Usa o paginator para seguir o NextToken caso a resposta venha
+        dividida em mais de uma página, evitando falsos "não encontrados".
+
+        Args:
+            batch: Lote de nomes de alarmes (máximo 100)
+
+        Returns:
+            Lista de alarmes retornados pela API
+        """
+        # Lotes idênticos buscados há pouco tempo saem direto do cache
+        key = tuple(batch)
+        now = time.monotonic()
+        with self._describe_cache_lock:
+            cached = self._describe_cache.get(key)
+            if cached and now - cached[0] < self.DESCRIBE_CACHE_TTL:
+                return cached[1]
+
+        metric_alarms = []
+        paginator = self.cloudwatch.get_paginator('describe_alarms')
+        for page in paginator.paginate(AlarmNames=batch, PaginationConfig={'PageSize': self.MAX_BATCH_SIZE}):
+            metric_alarms.extend(page['MetricAlarms'])
+
+        with self._describe_cache_lock:
+            self._describe_cache[key] = (now, metric_alarms)
+        return metric_alarms
     
-    def update_alarm_sns_topic(self, alarm_name: str, topic_arn: str, 
-                               states: List[str], action: str) -> Dict:
+    def _needs_update(self, alarm: Dict, topic_arn: str,
+                      state_fields: Tuple[Tuple[str, str], ...], action: str) -> bool:
+        """
+        Verifica localmente (sem chamadas à AWS) se o alarme precisa de alteração.
+
+        Args:
+            alarm: Alarme completo já obtido via get_alarm_details
+            topic_arn: ARN do tópico SNS
+            state_fields: Pares (estado, campo de ações) pré-compilados
+            action: 'add' para adicionar, 'remove' para remover
+
+        Returns:
+            True se algum estado solicitado precisa ser alterado
+        """
+        for state, field in state_fields:
+            present = topic_arn in alarm.get(field, [])
+            if (action == 'add') != present:
+                return True
+        return False
+
+    def update_alarm_sns_topic(self, alarm: Dict, topic_arn: str,
+                               state_fields: Tuple[Tuple[str, str], ...], action: str) -> Dict:
         """
         Adiciona ou remove um tópico SNS de um alarme específico.
-        
+
         Args:
-            alarm_name: Nome do alarme
+            alarm: Alarme completo já obtido via get_alarm_details
             topic_arn: ARN do tópico SNS
-            states: Lista de estados onde aplicar a ação (OK, IN_ALARM, INSUFFICIENT_DATA)
+            state_fields: Pares (estado, campo de ações) pré-compilados
             action: 'add' para adicionar, 'remove' para remover
-            
+
         Returns:
             Dicionário com informações sobre a atualização:
             - 'success': bool indicando sucesso
@@ -149,119 +439,75 @@ class CloudWatchAlarmUpdater:
             'changes': [],
             'error': None
         }
-        
+
         try:
-            # Buscar alarme atual
-            response = self.cloudwatch.describe_alarms(AlarmNames=[alarm_name])
-            
-            if not response['MetricAlarms']:
-                result['error'] = f"Alarme '{alarm_name}' não encontrado"
-                return result
-            
-            alarm = response['MetricAlarms'][0]
-            
-            # Preparar ações por estado
-            ok_actions = set(alarm.get('OKActions', []))
-            alarm_actions = set(alarm.get('AlarmActions', []))
-            insufficient_data_actions = set(alarm.get('InsufficientDataActions', []))
-            
-            # Aplicar ação para cada estado e registrar mudanças
+            alarm_name = alarm['AlarmName']
+
+            # Aplicar a ação para cada estado solicitado; as listas de ações
+            # têm no máximo 5 entradas, então operar direto nelas é mais
+            # barato do que construir sets
+            new_actions = {}
             updated = False
-            if 'OK' in states:
-                if action == 'add' and topic_arn not in ok_actions:
-                    ok_actions.add(topic_arn)
-                    updated = True
-                    result['changes'].append('OK: Adicionado tópico SNS')
-                elif action == 'remove' and topic_arn in ok_actions:
-                    ok_actions.remove(topic_arn)
-                    updated = True
-                    result['changes'].append('OK: Removido tópico SNS')
-                elif action == 'add' and topic_arn in ok_actions:
-                    result['changes'].append('OK: Tópico já presente (nenhuma ação)')
-                elif action == 'remove' and topic_arn not in ok_actions:
-                    result['changes'].append('OK: Tópico não presente (nenhuma ação)')
-            
-            if 'IN_ALARM' in states:
-                if action == 'add' and topic_arn not in alarm_actions:
-                    alarm_actions.add(topic_arn)
-                    updated = True
-                    result['changes'].append('IN_ALARM: Adicionado tópico SNS')
-                elif action == 'remove' and topic_arn in alarm_actions:
-                    alarm_actions.remove(topic_arn)
-                    updated = True
-                    result['changes'].append('IN_ALARM: Removido tópico SNS')
-                elif action == 'add' and topic_arn in alarm_actions:
-                    result['changes'].append('IN_ALARM: Tópico já presente (nenhuma ação)')
-                elif action == 'remove' and topic_arn not in alarm_actions:
-                    result['changes'].append('IN_ALARM: Tópico não presente (nenhuma ação)')
-            
-            if 'INSUFFICIENT_DATA' in states:
-                if action == 'add' and topic_arn not in insufficient_data_actions:
-                    insufficient_data_actions.add(topic_arn)
-                    updated = True
-                    result['changes'].append('INSUFFICIENT_DATA: Adicionado tópico SNS')
-                elif action == 'remove' and topic_arn in insufficient_data_actions:
-                    insufficient_data_actions.remove(topic_arn)
-                    updated = True
-                    result['changes'].append('INSUFFICIENT_DATA: Removido tópico SNS')
-                elif action == 'add' and topic_arn in insufficient_data_actions:
-                    result['changes'].append('INSUFFICIENT_DATA: Tópico já presente (nenhuma ação)')
-                elif action == 'remove' and topic_arn not in insufficient_data_actions:
-                    result['changes'].append('INSUFFICIENT_DATA: Tópico não presente (nenhuma ação)')
-            
+            for state, field in state_fields:
+                current = alarm.get(field, [])
+                present = topic_arn in current
+
+                if action == 'add':
+                    if not present:
+                        new_actions[field] = current + [topic_arn]
+                        updated = True
+                    result['changes'].append(
+                        f'{state}: Tópico já presente (nenhuma ação)' if present
+                        else f'{state}: Adicionado tópico SNS'
+                    )
+                else:
+                    if present:
+                        new_actions[field] = [a for a in current if a != topic_arn]
+                        updated = True
+                    result['changes'].append(
+                        f'{state}: Removido tópico SNS' if present
+                        else f'{state}: Tópico não presente (nenhuma ação)'
+                    )
+
             if not updated and not result['changes']:
                 result['error'] = 'Nenhuma alteração necessária'
                 return result
             
             # Atualizar alarme (se não for dry-run e houver mudanças)
             if not self.dry_run and updated:
-                # Construir parâmetros do alarme preservando todos os campos originais
+                # Construir parâmetros preservando em uma única passada todos
+                # os campos originais presentes no alarme
                 put_params = {
-                    'AlarmName': alarm_name,
-                    'MetricName': alarm['MetricName'],
-                    'Namespace': alarm['Namespace'],
-                    'Period': alarm['Period'],
-                    'EvaluationPeriods': alarm['EvaluationPeriods'],
-                    'Threshold': alarm['Threshold'],
-                    'ComparisonOperator': alarm['ComparisonOperator'],
-                    'OKActions': list(ok_actions),
-                    'AlarmActions': list(alarm_actions),
-                    'InsufficientDataActions': list(insufficient_data_actions),
+                    field: alarm[field]
+                    for field in self.PUT_METRIC_ALARM_FIELDS
+                    if field in alarm and alarm[field] not in (None, [], '')
                 }
-                
-                # Campos opcionais que podem estar presentes
-                if 'Statistic' in alarm:
-                    put_params['Statistic'] = alarm['Statistic']
-                if 'ExtendedStatistic' in alarm:
-                    put_params['ExtendedStatistic'] = alarm['ExtendedStatistic']
-                if 'Unit' in alarm:
-                    put_params['Unit'] = alarm['Unit']
-                if 'AlarmDescription' in alarm:
-                    put_params['AlarmDescription'] = alarm['AlarmDescription']
-                if 'TreatMissingData' in alarm:
-                    put_params['TreatMissingData'] = alarm['TreatMissingData']
-                else:
-                    put_params['TreatMissingData'] = 'missing'
-                if 'Dimensions' in alarm and alarm['Dimensions']:
-                    put_params['Dimensions'] = alarm['Dimensions']
-                if 'DatapointsToAlarm' in alarm:
-                    put_params['DatapointsToAlarm'] = alarm['DatapointsToAlarm']
-                if 'ThresholdMetricId' in alarm:
-                    put_params['ThresholdMetricId'] = alarm['ThresholdMetricId']
-                if 'Metrics' in alarm and alarm['Metrics']:
-                    put_params['Metrics'] = alarm['Metrics']
-                if 'Tags' in alarm and alarm['Tags']:
-                    put_params['Tags'] = alarm['Tags']
-                if 'ActionsEnabled' in alarm:
-                    put_params['ActionsEnabled'] = alarm['ActionsEnabled']
-                
+                # Alarmes de metric math não aceitam os campos de métrica simples
+                if put_params.get('Metrics'):
+                    for field in self.SINGLE_METRIC_FIELDS:
+                        put_params.pop(field, None)
+
+                put_params['AlarmName'] = alarm_name
+                put_params['OKActions'] = list(new_actions.get('OKActions', alarm.get('OKActions', [])))
+                put_params['AlarmActions'] = list(new_actions.get('AlarmActions', alarm.get('AlarmActions', [])))
+                put_params['InsufficientDataActions'] = list(new_actions.get('InsufficientDataActions', alarm.get('InsufficientDataActions', [])))
+                put_params.setdefault('TreatMissingData', 'missing')
+
+                # Respeitar o limite de requisições por segundo, se definido
+                if self._rate_limiter:
+                    self._rate_limiter.acquire()
+
                 self.cloudwatch.put_metric_alarm(**put_params)
             
             result['success'] = True
             return result
             
         except ClientError as e:
-            result['error'] = f"Erro ao atualizar alarme: {e}"
+            error_code = e.response.get('Error', {}).get('Code', '')
+            if error_code in self.THROTTLING_ERROR_CODES:
+                result['error'] = f"Throttling persistente após retries adaptativos ({error_code}): {e}"
+            else:
+                result['error'] = f"Erro ao atualizar alarme: {e}"
             return result
         except Exception as e:
             result['error'] = f"Erro inesperado: {e}"
@@ -281,13 +527,14 @@ class CloudWatchAlarmUpdater:
         Returns:
             Dicionário com estatísticas do processamento
         """
-        # Validar estados
-        invalid_states = [s for s in states if s not in self.VALID_STATES]
-        if invalid_states:
-            print(f"✗ Estados inválidos: {', '.join(invalid_states)}")
-            print(f"  Estados válidos: {', '.join(self.VALID_STATES)}")
-            sys.exit(1)
-        
+        # Pré-compilar os pares (estado, campo de ações) uma única vez;
+        # os loops por alarme só iteram essa tupla
+        state_fields = tuple((state, self.STATE_TO_KEY[state]) for state in states)
+
+        # Internar o ARN: os testes de pertinência feitos milhares de vezes
+        # passam a comparar por identidade antes de comparar conteúdo
+        topic_arn = sys.intern(topic_arn)
+
         # Carregar lista de alarmes
         alarm_names = self.load_alarm_list(alarm_list_path)
         
@@ -313,7 +560,10 @@ class CloudWatchAlarmUpdater:
             else:
                 print("✗ Nenhum alarme válido encontrado")
                 sys.exit(1)
-        
+
+        # Ordenar uma única vez; a ordem alfabética é só para exibição
+        ordered_names = sorted(alarms_details)
+
         # Modo dry-run: apenas mostrar o que seria feito
         if self.dry_run:
             print(f"\n{'='*60}")
@@ -328,29 +578,30 @@ class CloudWatchAlarmUpdater:
             print(f"\nDetalhes por alarme:")
             print(f"{'-'*60}")
             
-            for alarm_name in sorted(alarms_details.keys()):
+            # Acumular a saída e gravar em blocos, como no relatório de execução
+            lines = []
+            for count, alarm_name in enumerate(ordered_names, start=1):
                 details = alarms_details[alarm_name]
-                print(f"\nAlarme: {alarm_name}")
-                for state in states:
-                    if state == 'OK':
-                        current = details['OKActions']
-                        has_topic = topic_arn in current
-                    elif state == 'IN_ALARM':
-                        current = details['AlarmActions']
-                        has_topic = topic_arn in current
-                    elif state == 'INSUFFICIENT_DATA':
-                        current = details['InsufficientDataActions']
-                        has_topic = topic_arn in current
-                    
+                lines.append(f"\nAlarme: {alarm_name}")
+                for state, field in state_fields:
+                    has_topic = topic_arn in details.get(field, [])
+
                     if action == 'add' and not has_topic:
-                        print(f"  [{state}]: Adicionar tópico SNS")
+                        lines.append(f"  [{state}]: Adicionar tópico SNS")
                     elif action == 'remove' and has_topic:
-                        print(f"  [{state}]: Remover tópico SNS")
+                        lines.append(f"  [{state}]: Remover tópico SNS")
                     elif action == 'add' and has_topic:
-                        print(f"  [{state}]: Tópico já presente (nenhuma ação)")
+                        lines.append(f"  [{state}]: Tópico já presente (nenhuma ação)")
                     elif action == 'remove' and not has_topic:
-                        print(f"  [{state}]: Tópico não presente (nenhuma ação)")
-            
+                        lines.append(f"  [{state}]: Tópico não presente (nenhuma ação)")
+
+                if count % 100 == 0:
+                    sys.stdout.write('\n'.join(lines) + '\n')
+                    lines = []
+
+            if lines:
+                sys.stdout.write('\n'.join(lines) + '\n')
+
             print(f"\n{'-'*60}")
             print("Fim do modo dry-run")
             return {
@@ -381,25 +632,62 @@ class CloudWatchAlarmUpdater:
             'no_changes': 0
         }
         
-        # Processar alarmes encontrados
-        for alarm_name in sorted(alarms_details.keys()):
-            print(f"Alarme: {alarm_name}")
-            
-            result = self.update_alarm_sns_topic(alarm_name, topic_arn, states, action)
-            
+        # Separar localmente os alarmes que já estão no estado desejado;
+        # esses dispensam qualquer chamada à AWS
+        results = {}
+        to_update = []
+        no_change_suffix = (
+            'Tópico já presente (nenhuma ação)' if action == 'add'
+            else 'Tópico não presente (nenhuma ação)'
+        )
+        for alarm_name, alarm in alarms_details.items():
+            if self._needs_update(alarm, topic_arn, state_fields, action):
+                to_update.append(alarm_name)
+            else:
+                results[alarm_name] = {
+                    'success': True,
+                    'changes': [f'{state}: {no_change_suffix}' for state in states],
+                    'error': None
+                }
+                stats['processed'] += 1
+
+        # Processar em paralelo apenas os alarmes que precisam de alteração
+        stats_lock = threading.Lock()
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {
+                executor.submit(
+                    self.update_alarm_sns_topic,
+                    alarms_details[alarm_name], topic_arn, state_fields, action
+                ): alarm_name
+                for alarm_name in to_update
+            }
+            for future in concurrent.futures.as_completed(futures):
+                alarm_name = futures[future]
+                results[alarm_name] = future.result()
+                with stats_lock:
+                    stats['processed'] += 1
+
+        # Mostrar resultados em ordem alfabética após a conclusão, gravando
+        # em blocos para não pagar um flush de stdout por linha
+        lines = []
+        for processed_count, alarm_name in enumerate(ordered_names, start=1):
+            lines.append(f"Alarme: {alarm_name}")
+
+            result = results[alarm_name]
+
             if result['error']:
-                print(f"  ✗ {result['error']}")
+                lines.append(f"  ✗ {result['error']}")
                 stats['failed'] += 1
             elif result['success']:
                 # Mostrar detalhes das mudanças
                 if result['changes']:
                     for change in result['changes']:
                         if 'nenhuma ação' in change.lower():
-                            print(f"  ⚪ {change}")
+                            lines.append(f"  ⚪ {change}")
                         elif 'Adicionado' in change:
-                            print(f"  ✓ {change}")
+                            lines.append(f"  ✓ {change}")
                         elif 'Removido' in change:
-                            print(f"  ✓ {change}")
+                            lines.append(f"  ✓ {change}")
                     # Verificar se houve alteração real (não apenas "nenhuma ação")
                     has_real_change = any('nenhuma ação' not in c.lower() for c in result['changes'])
                     if has_real_change:
@@ -407,14 +695,20 @@ class CloudWatchAlarmUpdater:
                     else:
                         stats['no_changes'] += 1
                 else:
-                    print(f"  ⚪ Nenhuma alteração necessária")
+                    lines.append("  ⚪ Nenhuma alteração necessária")
                     stats['no_changes'] += 1
             else:
-                print(f"  ✗ Falha ao processar")
+                lines.append("  ✗ Falha ao processar")
                 stats['failed'] += 1
-            
-            stats['processed'] += 1
-            print()  # Linha em branco entre alarmes
+
+            lines.append('')  # Linha em branco entre alarmes
+
+            if processed_count % 100 == 0:
+                sys.stdout.write('\n'.join(lines) + '\n')
+                lines = []
+
+        if lines:
+            sys.stdout.write('\n'.join(lines) + '\n')
         
         # Resumo
         print(f"{'='*60}")
@@ -484,19 +778,58 @@ ou pelo workflow do GitHub Actions que assume a role automaticamente).
         action='store_true',
         help='Executar em modo dry-run (apenas mostrar o que seria feito)'
     )
-    
+
+    parser.add_argument(
+        '--max-workers',
+        type=int,
+        default=CloudWatchAlarmUpdater.MAX_WORKERS,
+        help='Número de threads para atualizar alarmes em paralelo (padrão: 8)'
+    )
+
+    parser.add_argument(
+        '--batch-size',
+        type=int,
+        default=CloudWatchAlarmUpdater.MAX_BATCH_SIZE,
+        help='Tamanho dos lotes de busca de alarmes (máximo: 100)'
+    )
+
+    parser.add_argument(
+        '--rate-limit',
+        type=float,
+        default=None,
+        help='Limite de atualizações por segundo (padrão: sem limite)'
+    )
+
     args = parser.parse_args()
-    
+
+    # Fora de um terminal (CI), deixar o Python bufferizar a saída em vez
+    # de pagar um flush por linha
+    if not sys.stdout.isatty() and hasattr(sys.stdout, 'reconfigure'):
+        sys.stdout.reconfigure(line_buffering=False, write_through=False)
+
     # Processar estados
     states = [s.strip().upper() for s in args.states.split(',')]
-    
+
+    # Validar entradas antes de inicializar o cliente AWS:
+    # erro de digitação não deve pagar o custo de setup de credenciais
+    invalid_states = [s for s in states if s not in CloudWatchAlarmUpdater.VALID_STATES]
+    if invalid_states:
+        print(f"✗ Estados inválidos: {', '.join(invalid_states)}")
+        print(f"  Estados válidos: {', '.join(CloudWatchAlarmUpdater.VALID_STATES)}")
+        sys.exit(1)
+
     # Validar formato do ARN do tópico
     if not args.topic_arn.startswith('arn:aws:sns:'):
         print("✗ Erro: ARN do tópico SNS inválido (deve começar com 'arn:aws:sns:')")
         sys.exit(1)
-    
+
     # Criar atualizador e processar
-    updater = CloudWatchAlarmUpdater(dry_run=args.dry_run)
+    updater = CloudWatchAlarmUpdater(
+        dry_run=args.dry_run,
+        max_workers=args.max_workers,
+        batch_size=args.batch_size,
+        rate_limit=args.rate_limit
+    )
     updater.process_alarms(
         alarm_list_path=args.list_alarms,
         topic_arn=args.topic_arn,